@@ -4,11 +4,12 @@ import threading
 from asyncio import QueueEmpty as AsyncQueueEmpty
 from asyncio import QueueFull as AsyncQueueFull
 from collections import deque
+from functools import partial
 from heapq import heappop, heappush
 from queue import Empty as SyncQueueEmpty
 from queue import Full as SyncQueueFull
-from time import monotonic
-from typing import Callable, Generic, Optional, Protocol, TypeVar
+from time import monotonic_ns
+from typing import Callable, Generic, Iterable, Optional, Protocol, TypeVar
 
 if sys.version_info >= (3, 13):
     from asyncio import QueueShutDown as AsyncQueueShutDown
@@ -45,8 +46,33 @@ __all__ = (
 T = TypeVar("T")
 OptFloat = Optional[float]
 
+# Numbers of callers blocked on the not-empty/not-full conditions are packed
+# into a single int (Queue._waiters), one field per counter, so the common
+# "nobody is waiting" case is detected by a single check after put/get.
+# Fields are wide enough to never overflow into each other.
+_WAITERS_BITS = 32
+_SYNC_NOT_EMPTY = 1
+_SYNC_NOT_FULL = 1 << _WAITERS_BITS
+_ASYNC_NOT_EMPTY = 1 << 2 * _WAITERS_BITS
+_ASYNC_NOT_FULL = 1 << 3 * _WAITERS_BITS
+_SYNC_NOT_EMPTY_MASK = _SYNC_NOT_FULL - _SYNC_NOT_EMPTY
+_SYNC_NOT_FULL_MASK = _ASYNC_NOT_EMPTY - _SYNC_NOT_FULL
+_ASYNC_NOT_EMPTY_MASK = _ASYNC_NOT_FULL - _ASYNC_NOT_EMPTY
+_ASYNC_NOT_FULL_MASK = (1 << 4 * _WAITERS_BITS) - _ASYNC_NOT_FULL
+
+
+def _wakeup_next(waiters: "deque[asyncio.Future[None]]") -> None:
+    # Wake up the next waiter (if any) that isn't cancelled.
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            break
+
 
 class BaseQueue(Protocol[T]):
+    __slots__ = ()
+
     @property
     def maxsize(self) -> int: ...
 
@@ -72,6 +98,7 @@ class BaseQueue(Protocol[T]):
 
 
 class SyncQueue(BaseQueue[T], Protocol[T]):
+    __slots__ = ()
 
     def put(self, item: T, block: bool = True, timeout: OptFloat = None) -> None: ...
 
@@ -81,6 +108,8 @@ class SyncQueue(BaseQueue[T], Protocol[T]):
 
 
 class AsyncQueue(BaseQueue[T], Protocol[T]):
+    __slots__ = ()
+
     async def put(self, item: T) -> None: ...
 
     async def get(self) -> T: ...
@@ -99,32 +128,32 @@ class Queue(Generic[T]):
         self._is_shutdown = False
 
         self._init(maxsize)
+        self._bind_storage()
 
         self._unfinished_tasks = 0
+        # packed counters of blocked put()/get() callers, see _SYNC_NOT_EMPTY
+        self._waiters = 0
 
         self._sync_mutex = threading.Lock()
-        self._sync_not_empty = threading.Condition(self._sync_mutex)
-        self._sync_not_empty_waiting = 0
-        self._sync_not_full = threading.Condition(self._sync_mutex)
-        self._sync_not_full_waiting = 0
-        self._sync_tasks_done = threading.Condition(self._sync_mutex)
-        self._sync_tasks_done_waiting = 0
-
-        self._async_mutex = asyncio.Lock()
-        if sys.version_info[:3] == (3, 10, 0):
-            # Workaround for Python 3.10 bug, see #358:
-            getattr(self._async_mutex, "_get_loop", lambda: None)()
-        self._async_not_empty = asyncio.Condition(self._async_mutex)
-        self._async_not_empty_waiting = 0
-        self._async_not_full = asyncio.Condition(self._async_mutex)
-        self._async_not_full_waiting = 0
-        self._async_tasks_done = asyncio.Condition(self._async_mutex)
-        self._async_tasks_done_waiting = 0
-
-        self._pending: deque[asyncio.Future[None]] = deque()
-
-        self._sync_queue = _SyncQueueProxy(self)
-        self._async_queue = _AsyncQueueProxy(self)
+        # set and dropped when the count of unfinished tasks drops to zero,
+        # created by the first sync join() call that has to wait
+        self._sync_finished: Optional[threading.Event] = None
+        # futures of async join() callers, resolved when the count
+        # of unfinished tasks drops to zero
+        self._async_join_waiters: list[asyncio.Future[None]] = []
+
+        # scheduled but not executed yet async notifications,
+        # a method -> number of calls mapping
+        self._async_notifications: dict[Callable[[], None], int] = {}
+
+        # Synchronization primitives of each side are created on the first
+        # access to sync_q/async_q, see _create_sync_queue()
+        # and _create_async_queue()
+        self._sync_queue: Optional[_SyncQueueProxy[T]] = None
+        self._async_queue: Optional[_AsyncQueueProxy[T]] = None
+        if sys.version_info < (3, 10):
+            # asyncio primitives are bound to the event loop on creation
+            self._create_async_queue()
 
     def _get_loop(self) -> asyncio.AbstractEventLoop:
         # Warning!
@@ -159,19 +188,20 @@ class Queue(Generic[T]):
                     if self._unfinished_tasks > 0:
                         self._unfinished_tasks -= 1
                 # release all blocked threads in `join()`
-                if self._sync_tasks_done_waiting:
-                    self._sync_tasks_done.notify_all()
-                if self._async_tasks_done_waiting:
-                    self._notify_async(self._async_tasks_done.notify_all)
+                sync_finished = self._sync_finished
+                if sync_finished is not None and not self._unfinished_tasks:
+                    self._sync_finished = None
+                    sync_finished.set()
+                if self._async_join_waiters:
+                    self._notify_async(self._wakeup_async_joiners)
             # All getters need to re-check queue-empty to raise ShutDown
-            if self._sync_not_empty_waiting:
+            waiters = self._waiters
+            if waiters & _SYNC_NOT_EMPTY_MASK:
                 self._sync_not_empty.notify_all()
-            if self._sync_not_full_waiting:
+            if waiters & _SYNC_NOT_FULL_MASK:
                 self._sync_not_full.notify_all()
-            if self._async_not_empty_waiting:
-                self._notify_async(self._async_not_empty.notify_all)
-            if self._async_not_full_waiting:
-                self._notify_async(self._async_not_full.notify_all)
+            if waiters & (_ASYNC_NOT_EMPTY_MASK | _ASYNC_NOT_FULL_MASK):
+                self._notify_async(self._wakeup_all_async_waiters)
 
     def close(self) -> None:
         """Close the queue.
@@ -187,14 +217,10 @@ class Queue(Generic[T]):
         # so lock acquiring is not required
         if not self._is_shutdown:
             raise RuntimeError("Waiting for non-closed queue")
-        # give a chance for the task-done callbacks
-        # of async tasks created inside
+        # give a chance for the callbacks scheduled by
         # _notify_async()
-        # methods to be executed.
+        # method to be executed.
         await asyncio.sleep(0)
-        if not self._pending:
-            return
-        await asyncio.wait(self._pending)
 
     async def aclose(self) -> None:
         """Shutdown the queue and wait for actual shutting down"""
@@ -203,7 +229,7 @@ class Queue(Generic[T]):
 
     @property
     def closed(self) -> bool:
-        return self._is_shutdown and not self._pending
+        return self._is_shutdown and not self._async_notifications
 
     @property
     def maxsize(self) -> int:
@@ -211,11 +237,37 @@ class Queue(Generic[T]):
 
     @property
     def sync_q(self) -> "_SyncQueueProxy[T]":
-        return self._sync_queue
+        sync_queue = self._sync_queue
+        if sync_queue is None:
+            sync_queue = self._create_sync_queue()
+        return sync_queue
 
     @property
     def async_q(self) -> "_AsyncQueueProxy[T]":
-        return self._async_queue
+        async_queue = self._async_queue
+        if async_queue is None:
+            async_queue = self._create_async_queue()
+        return async_queue
+
+    def _create_sync_queue(self) -> "_SyncQueueProxy[T]":
+        # Nobody can wait on the sync conditions before the sync proxy is
+        # published, so the rest of the code doesn't check for their presence
+        with self._sync_mutex:
+            sync_queue = self._sync_queue
+            if sync_queue is None:
+                self._sync_not_empty = threading.Condition(self._sync_mutex)
+                self._sync_not_full = threading.Condition(self._sync_mutex)
+                sync_queue = self._sync_queue = _SyncQueueProxy(self)
+            return sync_queue
+
+    def _create_async_queue(self) -> "_AsyncQueueProxy[T]":
+        with self._sync_mutex:
+            async_queue = self._async_queue
+            if async_queue is None:
+                self._async_getters: deque[asyncio.Future[None]] = deque()
+                self._async_putters: deque[asyncio.Future[None]] = deque()
+                async_queue = self._async_queue = _AsyncQueueProxy(self)
+            return async_queue
 
     # Override these methods to implement other queue organizations
     # (e.g. stack or priority queue).
@@ -224,6 +276,21 @@ class Queue(Generic[T]):
     def _init(self, maxsize: int) -> None:
         self._queue: deque[T] = deque()
 
+    def _bind_storage(self) -> None:
+        # Called after _init() so that a container replaced by a subclass
+        # is picked up. Call deque methods directly, skipping the
+        # Python-level wrappers below, unless a subclass overrides them
+        queue = getattr(self, "_queue", None)
+        if type(queue) is not deque:
+            return
+        cls = type(self)
+        if cls._qsize is Queue._qsize:
+            self._qsize = queue.__len__  # type: ignore
+        if cls._put is Queue._put:
+            self._put = queue.append  # type: ignore
+        if cls._get is Queue._get:
+            self._get = queue.popleft  # type: ignore
+
     def _qsize(self) -> int:
         return len(self._queue)
 
@@ -235,20 +302,34 @@ class Queue(Generic[T]):
     def _get(self) -> T:
         return self._queue.popleft()
 
-    def _put_internal(self, item: T) -> None:
-        self._put(item)
-        self._unfinished_tasks += 1
+    # The following methods should be called from the event loop thread
 
-    async def _do_async_notifier(self, method: Callable[[], None]) -> None:
-        async with self._async_mutex:
-            method()
+    def _wakeup_async_getter(self) -> None:
+        _wakeup_next(self._async_getters)
 
-    def _setup_async_notifier(
-        self, loop: asyncio.AbstractEventLoop, method: Callable[[], None]
-    ) -> None:
-        task = loop.create_task(self._do_async_notifier(method))
-        task.add_done_callback(self._pending.remove)
-        self._pending.append(task)
+    def _wakeup_async_putter(self) -> None:
+        _wakeup_next(self._async_putters)
+
+    def _wakeup_all_async_waiters(self) -> None:
+        for waiters in (self._async_getters, self._async_putters):
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    def _wakeup_async_joiners(self) -> None:
+        waiters = self._async_join_waiters
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        waiters.clear()
+
+    def _do_async_notifier(self, method: Callable[[], None]) -> None:
+        # Grab all notifications requested since the callback was scheduled
+        with self._sync_mutex:
+            count = self._async_notifications.pop(method)
+        for _ in range(count):
+            method()
 
     def _notify_async(self, method: Callable[[], None]) -> None:
         # Warning!
@@ -258,7 +339,19 @@ class Queue(Generic[T]):
         if loop is None or loop.is_closed():
             # async API is not available, nothing to notify
             return
-        loop.call_soon_threadsafe(self._setup_async_notifier, loop, method)
+        notifications = self._async_notifications
+        if method in notifications:
+            # A notifier is already scheduled, let it call the method
+            # once more instead of scheduling a new callback
+            notifications[method] += 1
+            return
+        notifications[method] = 1
+        if asyncio._get_running_loop() is loop:
+            # Called from the event loop thread, no need to wake up
+            # the loop through its self-pipe
+            loop.call_soon(self._do_async_notifier, method)
+        else:
+            loop.call_soon_threadsafe(self._do_async_notifier, method)
 
 
 class _SyncQueueProxy(SyncQueue[T]):
@@ -267,6 +360,8 @@ class _SyncQueueProxy(SyncQueue[T]):
     If maxsize is <= 0, the queue size is infinite.
     """
 
+    __slots__ = ("_parent", "__weakref__")
+
     def __init__(self, parent: Queue[T]):
         self._parent = parent
 
@@ -293,15 +388,17 @@ class _SyncQueueProxy(SyncQueue[T]):
         placed in the queue.
         """
         parent = self._parent
-        with parent._sync_tasks_done:
+        with parent._sync_mutex:
             unfinished = parent._unfinished_tasks - 1
             if unfinished <= 0:
                 if unfinished < 0:
                     raise ValueError("task_done() called too many times")
-                if parent._sync_tasks_done_waiting:
-                    parent._sync_tasks_done.notify_all()
-                if parent._async_tasks_done_waiting:
-                    parent._notify_async(parent._async_tasks_done.notify_all)
+                sync_finished = parent._sync_finished
+                if sync_finished is not None:
+                    parent._sync_finished = None
+                    sync_finished.set()
+                if parent._async_join_waiters:
+                    parent._notify_async(parent._wakeup_async_joiners)
             parent._unfinished_tasks = unfinished
 
     def join(self) -> None:
@@ -314,13 +411,16 @@ class _SyncQueueProxy(SyncQueue[T]):
         When the count of unfinished tasks drops to zero, join() unblocks.
         """
         parent = self._parent
-        with parent._sync_tasks_done:
-            while parent._unfinished_tasks:
-                parent._sync_tasks_done_waiting += 1
-                try:
-                    parent._sync_tasks_done.wait()
-                finally:
-                    parent._sync_tasks_done_waiting -= 1
+        while True:
+            with parent._sync_mutex:
+                if not parent._unfinished_tasks:
+                    return
+                # the event is dropped once set, a new put() may have
+                # happened since, so fetch the current one on every pass
+                sync_finished = parent._sync_finished
+                if sync_finished is None:
+                    sync_finished = parent._sync_finished = threading.Event()
+            sync_finished.wait()
 
     def qsize(self) -> int:
         """Return the approximate size of the queue (not reliable!)."""
@@ -367,42 +467,52 @@ class _SyncQueueProxy(SyncQueue[T]):
         is ignored in that case).
         """
         parent = self._parent
-        with parent._sync_not_full:
+        with parent._sync_mutex:
             if parent._is_shutdown:
                 raise SyncQueueShutDown
-            if parent._maxsize > 0:
+            maxsize = parent._maxsize
+            if maxsize > 0:
+                qsize = parent._qsize
                 if not block:
-                    if parent._qsize() >= parent._maxsize:
+                    if qsize() >= maxsize:
                         raise SyncQueueFull
                 elif timeout is None:
-                    while parent._qsize() >= parent._maxsize:
-                        parent._sync_not_full_waiting += 1
+                    wait = parent._sync_not_full.wait
+                    while qsize() >= maxsize:
+                        parent._waiters += _SYNC_NOT_FULL
                         try:
-                            parent._sync_not_full.wait()
+                            wait()
                         finally:
-                            parent._sync_not_full_waiting -= 1
+                            parent._waiters -= _SYNC_NOT_FULL
                         if parent._is_shutdown:
                             raise SyncQueueShutDown
                 elif timeout < 0:
                     raise ValueError("'timeout' must be a non-negative number")
                 else:
-                    endtime = monotonic() + timeout
-                    while parent._qsize() >= parent._maxsize:
-                        remaining = endtime - monotonic()
-                        if remaining <= 0.0:
+                    wait = parent._sync_not_full.wait
+                    endtime: Optional[int] = None
+                    while qsize() >= maxsize:
+                        if endtime is None:
+                            # only when a wait is needed, int() fails on inf/nan
+                            endtime = monotonic_ns() + int(timeout * 1e9)
+                        remaining = endtime - monotonic_ns()
+                        if remaining <= 0:
                             raise SyncQueueFull
-                        parent._sync_not_full_waiting += 1
+                        parent._waiters += _SYNC_NOT_FULL
                         try:
-                            parent._sync_not_full.wait(remaining)
+                            wait(remaining / 1e9)
                         finally:
-                            parent._sync_not_full_waiting -= 1
+                            parent._waiters -= _SYNC_NOT_FULL
                         if parent._is_shutdown:
                             raise SyncQueueShutDown
-            parent._put_internal(item)
-            if parent._sync_not_empty_waiting:
-                parent._sync_not_empty.notify()
-            if parent._async_not_empty_waiting:
-                parent._notify_async(parent._async_not_empty.notify)
+            parent._put(item)
+            parent._unfinished_tasks += 1
+            waiters = parent._waiters
+            if waiters:
+                if waiters & _SYNC_NOT_EMPTY_MASK:
+                    parent._sync_not_empty.notify()
+                if waiters & _ASYNC_NOT_EMPTY_MASK:
+                    parent._notify_async(parent._wakeup_async_getter)
 
     def get(self, block: bool = True, timeout: OptFloat = None) -> T:
         """Remove and return an item from the queue.
@@ -416,41 +526,49 @@ class _SyncQueueProxy(SyncQueue[T]):
         in that case).
         """
         parent = self._parent
-        with parent._sync_not_empty:
-            if parent._is_shutdown and not parent._qsize():
+        with parent._sync_mutex:
+            qsize = parent._qsize
+            if parent._is_shutdown and not qsize():
                 raise SyncQueueShutDown
             if not block:
-                if not parent._qsize():
+                if not qsize():
                     raise SyncQueueEmpty
             elif timeout is None:
-                while not parent._qsize():
-                    parent._sync_not_empty_waiting += 1
+                wait = parent._sync_not_empty.wait
+                while not qsize():
+                    parent._waiters += _SYNC_NOT_EMPTY
                     try:
-                        parent._sync_not_empty.wait()
+                        wait()
                     finally:
-                        parent._sync_not_empty_waiting -= 1
-                    if parent._is_shutdown and not parent._qsize():
+                        parent._waiters -= _SYNC_NOT_EMPTY
+                    if parent._is_shutdown and not qsize():
                         raise SyncQueueShutDown
             elif timeout < 0:
                 raise ValueError("'timeout' must be a non-negative number")
             else:
-                endtime = monotonic() + timeout
-                while not parent._qsize():
-                    remaining = endtime - monotonic()
-                    if remaining <= 0.0:
+                wait = parent._sync_not_empty.wait
+                endtime: Optional[int] = None
+                while not qsize():
+                    if endtime is None:
+                        # only when a wait is needed, int() fails on inf/nan
+                        endtime = monotonic_ns() + int(timeout * 1e9)
+                    remaining = endtime - monotonic_ns()
+                    if remaining <= 0:
                         raise SyncQueueEmpty
-                    parent._sync_not_empty_waiting += 1
+                    parent._waiters += _SYNC_NOT_EMPTY
                     try:
-                        parent._sync_not_empty.wait(remaining)
+                        wait(remaining / 1e9)
                     finally:
-                        parent._sync_not_empty_waiting -= 1
-                    if parent._is_shutdown and not parent._qsize():
+                        parent._waiters -= _SYNC_NOT_EMPTY
+                    if parent._is_shutdown and not qsize():
                         raise SyncQueueShutDown
             item = parent._get()
-            if parent._sync_not_full_waiting:
-                parent._sync_not_full.notify()
-            if parent._async_not_full_waiting:
-                parent._notify_async(parent._async_not_full.notify)
+            waiters = parent._waiters
+            if waiters:
+                if waiters & _SYNC_NOT_FULL_MASK:
+                    parent._sync_not_full.notify()
+                if waiters & _ASYNC_NOT_FULL_MASK:
+                    parent._notify_async(parent._wakeup_async_putter)
             return item
 
     def put_nowait(self, item: T) -> None:
@@ -459,7 +577,21 @@ class _SyncQueueProxy(SyncQueue[T]):
         Only enqueue the item if a free slot is immediately available.
         Otherwise raise the Full exception.
         """
-        return self.put(item, block=False)
+        parent = self._parent
+        with parent._sync_mutex:
+            if parent._is_shutdown:
+                raise SyncQueueShutDown
+            if 0 < parent._maxsize <= parent._qsize():
+                raise SyncQueueFull
+
+            parent._put(item)
+            parent._unfinished_tasks += 1
+            waiters = parent._waiters
+            if waiters:
+                if waiters & _SYNC_NOT_EMPTY_MASK:
+                    parent._sync_not_empty.notify()
+                if waiters & _ASYNC_NOT_EMPTY_MASK:
+                    parent._notify_async(parent._wakeup_async_getter)
 
     def get_nowait(self) -> T:
         """Remove and return an item from the queue without blocking.
@@ -467,7 +599,140 @@ class _SyncQueueProxy(SyncQueue[T]):
         Only get an item if one is immediately available. Otherwise
         raise the Empty exception.
         """
-        return self.get(block=False)
+        parent = self._parent
+        with parent._sync_mutex:
+            if parent._is_shutdown and not parent._qsize():
+                raise SyncQueueShutDown
+            if not parent._qsize():
+                raise SyncQueueEmpty
+
+            item = parent._get()
+            waiters = parent._waiters
+            if waiters:
+                if waiters & _SYNC_NOT_FULL_MASK:
+                    parent._sync_not_full.notify()
+                if waiters & _ASYNC_NOT_FULL_MASK:
+                    parent._notify_async(parent._wakeup_async_putter)
+            return item
+
+    def put_many(
+        self, items: Iterable[T], block: bool = True, timeout: OptFloat = None
+    ) -> None:
+        """Put all items into the queue.
+
+        Works like calling put() for every item in turn, but the mutex is
+        taken once per batch instead of once per item. 'block' and 'timeout'
+        have the same meaning as for put(), the timeout covers all waits
+        of the batch together. Consumers are notified before waiting for
+        a free slot, so a bounded queue smaller than the batch does not
+        deadlock.
+
+        'items' is consumed into a list before the mutex is taken. If the
+        Full exception is raised or the queue is shut down in the middle
+        of a batch, the items put so far stay in the queue and the rest
+        are dropped.
+        """
+        items = list(items)
+        parent = self._parent
+        with parent._sync_mutex:
+            if parent._is_shutdown:
+                raise SyncQueueShutDown
+            maxsize = parent._maxsize
+            if maxsize > 0 and block and timeout is not None and timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            qsize = parent._qsize
+            put = parent._put
+            endtime: Optional[int] = None
+            added = 0
+            try:
+                for item in items:
+                    if maxsize > 0 and qsize() >= maxsize:
+                        if not block:
+                            raise SyncQueueFull
+                        self._notify_not_empty(added)
+                        added = 0
+                        wait = parent._sync_not_full.wait
+                        while qsize() >= maxsize:
+                            remaining = None
+                            if timeout is not None:
+                                if endtime is None:
+                                    # set by the first wait of the batch
+                                    endtime = monotonic_ns() + int(timeout * 1e9)
+                                remaining = (endtime - monotonic_ns()) / 1e9
+                                if remaining <= 0:
+                                    raise SyncQueueFull
+                            parent._waiters += _SYNC_NOT_FULL
+                            try:
+                                wait(remaining)
+                            finally:
+                                parent._waiters -= _SYNC_NOT_FULL
+                            if parent._is_shutdown:
+                                raise SyncQueueShutDown
+                    put(item)
+                    parent._unfinished_tasks += 1
+                    added += 1
+            finally:
+                self._notify_not_empty(added)
+
+    def get_many(
+        self, max_items: int, block: bool = True, timeout: OptFloat = None
+    ) -> "list[T]":
+        """Remove and return up to 'max_items' items from the queue.
+
+        Wait for an item like get() does, with the same meaning of 'block'
+        and 'timeout', then take as many items as are immediately available
+        (but no more than 'max_items') in a single critical section.
+        """
+        if max_items < 1:
+            raise ValueError("'max_items' must be a positive number")
+        if block and timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        parent = self._parent
+        with parent._sync_mutex:
+            qsize = parent._qsize
+            if parent._is_shutdown and not qsize():
+                raise SyncQueueShutDown
+            if not qsize():
+                if not block:
+                    raise SyncQueueEmpty
+                endtime = None
+                if timeout is not None:
+                    endtime = monotonic_ns() + int(timeout * 1e9)
+                wait = parent._sync_not_empty.wait
+                while not qsize():
+                    remaining = None
+                    if endtime is not None:
+                        remaining = (endtime - monotonic_ns()) / 1e9
+                        if remaining <= 0:
+                            raise SyncQueueEmpty
+                    parent._waiters += _SYNC_NOT_EMPTY
+                    try:
+                        wait(remaining)
+                    finally:
+                        parent._waiters -= _SYNC_NOT_EMPTY
+                    if parent._is_shutdown and not qsize():
+                        raise SyncQueueShutDown
+            get = parent._get
+            items = [get() for _ in range(min(max_items, qsize()))]
+            waiters = parent._waiters
+            if waiters:
+                count = len(items)
+                if waiters & _SYNC_NOT_FULL_MASK:
+                    parent._sync_not_full.notify(count)
+                async_putters = (waiters & _ASYNC_NOT_FULL_MASK) >> 3 * _WAITERS_BITS
+                for _ in range(min(count, async_putters)):
+                    parent._notify_async(parent._wakeup_async_putter)
+            return items
+
+    def _notify_not_empty(self, count: int) -> None:
+        parent = self._parent
+        waiters = parent._waiters
+        if count and waiters:
+            if waiters & _SYNC_NOT_EMPTY_MASK:
+                parent._sync_not_empty.notify(count)
+            async_getters = (waiters & _ASYNC_NOT_EMPTY_MASK) >> 2 * _WAITERS_BITS
+            for _ in range(min(count, async_getters)):
+                parent._notify_async(parent._wakeup_async_getter)
 
     def shutdown(self, immediate: bool = False) -> None:
         """Shut-down the queue, making queue gets and puts raise an exception.
@@ -491,6 +756,8 @@ class _AsyncQueueProxy(AsyncQueue[T]):
     If maxsize is <= 0, the queue size is infinite.
     """
 
+    __slots__ = ("_parent", "__weakref__")
+
     def __init__(self, parent: Queue[T]):
         self._parent = parent
 
@@ -541,26 +808,47 @@ class _AsyncQueueProxy(AsyncQueue[T]):
         This method is a coroutine.
         """
         parent = self._parent
-        async with parent._async_not_full:
-            with parent._sync_mutex:
+        mutex = parent._sync_mutex
+        with mutex:
+            if parent._is_shutdown:
+                raise AsyncQueueShutDown
+            loop = parent._get_loop()  # check the event loop
+            maxsize = parent._maxsize
+            qsize = parent._qsize
+            while 0 < maxsize <= qsize():
+                putter = loop.create_future()
+                parent._async_putters.append(putter)
+                parent._waiters += _ASYNC_NOT_FULL
+                mutex.release()
+                try:
+                    await putter
+                except BaseException:
+                    mutex.acquire()
+                    parent._waiters -= _ASYNC_NOT_FULL
+                    putter.cancel()  # Just in case putter is not done yet.
+                    try:
+                        parent._async_putters.remove(putter)
+                    except ValueError:
+                        # The putter could be removed from putters by a
+                        # previous get call or a shutdown call.
+                        pass
+                    if not putter.cancelled() and not 0 < maxsize <= qsize():
+                        # We were woken up by a get call, but can't take
+                        # the slot.  Wake up the next in line.
+                        parent._wakeup_async_putter()
+                    raise
+                mutex.acquire()
+                parent._waiters -= _ASYNC_NOT_FULL
                 if parent._is_shutdown:
                     raise AsyncQueueShutDown
-                parent._get_loop()  # check the event loop
-                while 0 < parent._maxsize <= parent._qsize():
-                    parent._async_not_full_waiting += 1
-                    parent._sync_mutex.release()
-                    try:
-                        await parent._async_not_full.wait()
-                    finally:
-                        parent._sync_mutex.acquire()
-                        parent._async_not_full_waiting -= 1
-                    if parent._is_shutdown:
-                        raise AsyncQueueShutDown
-
-                parent._put_internal(item)
-                if parent._async_not_empty_waiting:
-                    parent._async_not_empty.notify()
-                if parent._sync_not_empty_waiting:
+
+            parent._put(item)
+            parent._unfinished_tasks += 1
+            waiters = parent._waiters
+            if waiters:
+                if waiters & _ASYNC_NOT_EMPTY_MASK:
+                    parent._wakeup_async_getter()
+                if waiters & _SYNC_NOT_EMPTY_MASK:
                     parent._sync_not_empty.notify()
 
     def put_nowait(self, item: T) -> None:
@@ -577,11 +865,14 @@ class _AsyncQueueProxy(AsyncQueue[T]):
             if 0 < parent._maxsize <= parent._qsize():
                 raise AsyncQueueFull
 
-            parent._put_internal(item)
-            if parent._async_not_empty_waiting:
-                parent._notify_async(parent._async_not_empty.notify)
-            if parent._sync_not_empty_waiting:
-                parent._sync_not_empty.notify()
+            parent._put(item)
+            parent._unfinished_tasks += 1
+            waiters = parent._waiters
+            if waiters:
+                if waiters & _ASYNC_NOT_EMPTY_MASK:
+                    parent._wakeup_async_getter()
+                if waiters & _SYNC_NOT_EMPTY_MASK:
+                    parent._sync_not_empty.notify()
 
     async def get(self) -> T:
         """Remove and return an item from the queue.
@@ -591,28 +882,47 @@ class _AsyncQueueProxy(AsyncQueue[T]):
         This method is a coroutine.
         """
         parent = self._parent
-        async with parent._async_not_empty:
-            with parent._sync_mutex:
-                if parent._is_shutdown and not parent._qsize():
-                    raise AsyncQueueShutDown
-                parent._get_loop()  # check the event loop
-                while not parent._qsize():
-                    parent._async_not_empty_waiting += 1
-                    parent._sync_mutex.release()
+        mutex = parent._sync_mutex
+        with mutex:
+            qsize = parent._qsize
+            if parent._is_shutdown and not qsize():
+                raise AsyncQueueShutDown
+            loop = parent._get_loop()  # check the event loop
+            while not qsize():
+                getter = loop.create_future()
+                parent._async_getters.append(getter)
+                parent._waiters += _ASYNC_NOT_EMPTY
+                mutex.release()
+                try:
+                    await getter
+                except BaseException:
+                    mutex.acquire()
+                    parent._waiters -= _ASYNC_NOT_EMPTY
+                    getter.cancel()  # Just in case getter is not done yet.
                     try:
-                        await parent._async_not_empty.wait()
-                    finally:
-                        parent._sync_mutex.acquire()
-                        parent._async_not_empty_waiting -= 1
-                    if parent._is_shutdown and not parent._qsize():
-                        raise AsyncQueueShutDown
-
-                item = parent._get()
-                if parent._async_not_full_waiting:
-                    parent._async_not_full.notify()
-                if parent._sync_not_full_waiting:
+                        parent._async_getters.remove(getter)
+                    except ValueError:
+                        # The getter could be removed from getters by a
+                        # previous put call or a shutdown call.
+                        pass
+                    if not getter.cancelled() and qsize():
+                        # We were woken up by a put call, but can't take
+                        # the item.  Wake up the next in line.
+                        parent._wakeup_async_getter()
+                    raise
+                mutex.acquire()
+                parent._waiters -= _ASYNC_NOT_EMPTY
+                if parent._is_shutdown and not qsize():
+                    raise AsyncQueueShutDown
+
+            item = parent._get()
+            waiters = parent._waiters
+            if waiters:
+                if waiters & _ASYNC_NOT_FULL_MASK:
+                    parent._wakeup_async_putter()
+                if waiters & _SYNC_NOT_FULL_MASK:
                     parent._sync_not_full.notify()
-                return item
+            return item
 
     def get_nowait(self) -> T:
         """Remove and return an item from the queue.
@@ -628,10 +938,12 @@ class _AsyncQueueProxy(AsyncQueue[T]):
 
             parent._get_loop()
             item = parent._get()
-            if parent._async_not_full_waiting:
-                parent._notify_async(parent._async_not_full.notify)
-            if parent._sync_not_full_waiting:
-                parent._sync_not_full.notify()
+            waiters = parent._waiters
+            if waiters:
+                if waiters & _ASYNC_NOT_FULL_MASK:
+                    parent._wakeup_async_putter()
+                if waiters & _SYNC_NOT_FULL_MASK:
+                    parent._sync_not_full.notify()
             return item
 
     def task_done(self) -> None:
@@ -649,15 +961,17 @@ class _AsyncQueueProxy(AsyncQueue[T]):
         the queue.
         """
         parent = self._parent
-        with parent._sync_tasks_done:
+        with parent._sync_mutex:
             if parent._unfinished_tasks <= 0:
                 raise ValueError("task_done() called too many times")
             parent._unfinished_tasks -= 1
             if parent._unfinished_tasks == 0:
-                if parent._async_tasks_done_waiting:
-                    parent._notify_async(parent._async_tasks_done.notify_all)
-                if parent._sync_tasks_done_waiting:
-                    parent._sync_tasks_done.notify_all()
+                if parent._async_join_waiters:
+                    parent._notify_async(parent._wakeup_async_joiners)
+                sync_finished = parent._sync_finished
+                if sync_finished is not None:
+                    parent._sync_finished = None
+                    sync_finished.set()
 
     async def join(self) -> None:
         """Block until all items in the queue have been gotten and processed.
@@ -668,17 +982,25 @@ class _AsyncQueueProxy(AsyncQueue[T]):
         When the count of unfinished tasks drops to zero, join() unblocks.
         """
         parent = self._parent
-        async with parent._async_tasks_done:
-            with parent._sync_mutex:
-                parent._get_loop()  # check the event loop
-                while parent._unfinished_tasks:
-                    parent._async_tasks_done_waiting += 1
-                    parent._sync_mutex.release()
+        mutex = parent._sync_mutex
+        with mutex:
+            loop = parent._get_loop()  # check the event loop
+            while parent._unfinished_tasks:
+                waiter = loop.create_future()
+                parent._async_join_waiters.append(waiter)
+                mutex.release()
+                try:
+                    await waiter
+                except BaseException:
+                    mutex.acquire()
                     try:
-                        await parent._async_tasks_done.wait()
-                    finally:
-                        parent._sync_mutex.acquire()
-                        parent._async_tasks_done_waiting -= 1
+                        parent._async_join_waiters.remove(waiter)
+                    except ValueError:
+                        # The waiter could be removed by a task_done()
+                        # call or a shutdown call.
+                        pass
+                    raise
+                mutex.acquire()
 
     def shutdown(self, immediate: bool = False) -> None:
         """Shut-down the queue, making queue gets and puts raise an exception.
@@ -707,6 +1029,18 @@ class PriorityQueue(Queue[T]):
     def _init(self, maxsize: int) -> None:
         self._heap_queue: list[T] = []
 
+    def _bind_storage(self) -> None:
+        heap_queue = getattr(self, "_heap_queue", None)
+        if type(heap_queue) is not list:
+            return
+        cls = type(self)
+        if cls._qsize is PriorityQueue._qsize:
+            self._qsize = heap_queue.__len__  # type: ignore
+        if cls._put is PriorityQueue._put:
+            self._put = partial(heappush, heap_queue)  # type: ignore
+        if cls._get is PriorityQueue._get:
+            self._get = partial(heappop, heap_queue)  # type: ignore
+
     def _qsize(self) -> int:
         return len(self._heap_queue)
 
@@ -720,11 +1054,11 @@ class PriorityQueue(Queue[T]):
 class LifoQueue(Queue[T]):
     """Variant of Queue that retrieves most recently added entries first."""
 
-    def _qsize(self) -> int:
-        return len(self._queue)
-
-    def _put(self, item: T) -> None:
-        self._queue.append(item)
+    def _bind_storage(self) -> None:
+        super()._bind_storage()
+        queue = getattr(self, "_queue", None)
+        if type(queue) is deque and type(self)._get is LifoQueue._get:
+            self._get = queue.pop  # type: ignore
 
     def _get(self) -> T:
         return self._queue.pop()
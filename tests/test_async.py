@@ -278,6 +278,26 @@ class TestQueueGetTests:
 
         await close(_q)
 
+    @pytest.mark.asyncio
+    async def test_get_cancelled_after_wakeup(self):
+        loop = asyncio.get_running_loop()
+        _q = janus.Queue()
+        q = _q.async_q
+
+        t1 = loop.create_task(q.get())
+        t2 = loop.create_task(q.get())
+        await asyncio.sleep(0.01)
+
+        q.put_nowait("a")  # wakes up t1
+        t1.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await t1
+        # the wakeup is passed to t2
+        assert await asyncio.wait_for(t2, timeout=0.1) == "a"
+
+        await close(_q)
+
     @pytest.mark.asyncio
     async def test_get_with_waiting_putters(self):
         loop = asyncio.get_running_loop()
@@ -682,6 +702,22 @@ class _QueueJoinTestMixin:
 
         await close(_q)
 
+    @pytest.mark.asyncio
+    async def test_join_cancelled(self):
+        _q = self.q_class()
+        q = _q.async_q
+
+        q.put_nowait(1)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(q.join(), timeout=0.01)
+        assert not _q._async_join_waiters
+
+        q.get_nowait()
+        q.task_done()
+        await asyncio.wait_for(q.join(), timeout=0.1)
+
+        await close(_q)
+
 
 class TestQueueJoin(_QueueJoinTestMixin):
     q_class = janus.Queue
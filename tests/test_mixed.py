@@ -1,7 +1,9 @@
 import asyncio
 import sys
+import weakref
 
 from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import pytest
 
@@ -310,7 +312,7 @@ class TestMixedMode:
             for _ in range(4):
                 executor.submit(q.sync_q.get)
 
-            while q._sync_not_empty_waiting != 4:
+            while q._waiters != 4 * janus._SYNC_NOT_EMPTY:
                 await asyncio.sleep(0.001)
 
             q.sync_q.put_nowait(1)
@@ -328,7 +330,7 @@ class TestMixedMode:
 
         tasks = [loop.create_task(q.async_q.get()) for _ in range(4)]
 
-        while q._async_not_empty_waiting != 4:
+        while q._waiters != 4 * janus._ASYNC_NOT_EMPTY:
             await asyncio.sleep(0)
 
         q.sync_q.put_nowait(1)
@@ -340,6 +342,47 @@ class TestMixedMode:
         assert q.sync_q.empty()
         await q.aclose()
 
+    @pytest.mark.asyncio
+    async def test_async_notifications_coalesced(self):
+        loop = asyncio.get_running_loop()
+        q = janus.Queue()
+
+        tasks = [loop.create_task(q.async_q.get()) for _ in range(4)]
+
+        while q._waiters != 4 * janus._ASYNC_NOT_EMPTY:
+            await asyncio.sleep(0)
+
+        for i in range(4):
+            q.sync_q.put(i)
+        assert q._async_notifications == {q._wakeup_async_getter: 4}
+
+        assert sorted(await asyncio.gather(*tasks)) == [0, 1, 2, 3]
+        assert not q._async_notifications
+        await q.aclose()
+
+    @pytest.mark.asyncio
+    async def test_sync_put_from_loop_thread_notifies_without_threadsafe(self):
+        loop = asyncio.get_running_loop()
+        q = janus.Queue()
+
+        task = loop.create_task(q.async_q.get())
+        while q._waiters != janus._ASYNC_NOT_EMPTY:
+            await asyncio.sleep(0)
+
+        with patch.object(loop, "call_soon_threadsafe") as func:
+            q.sync_q.put_nowait(1)
+            assert await task == 1
+            assert not func.called
+
+        await q.aclose()
+
+    @pytest.mark.asyncio
+    async def test_proxies_support_weakref(self):
+        q = janus.Queue()
+        assert weakref.ref(q.sync_q)() is q.sync_q
+        assert weakref.ref(q.async_q)() is q.async_q
+        await q.aclose()
+
     @pytest.mark.asyncio
     async def test_get_notifies_sync_not_full(self):
         loop = asyncio.get_running_loop()
@@ -351,7 +394,7 @@ class TestMixedMode:
             for _ in range(4):
                 executor.submit(q.sync_q.put, object())
 
-            while q._sync_not_full_waiting != 4:
+            while q._waiters != 4 * janus._SYNC_NOT_FULL:
                 await asyncio.sleep(0.001)
 
             q.sync_q.get_nowait()
@@ -371,7 +414,7 @@ class TestMixedMode:
 
         tasks = [loop.create_task(q.async_q.put(object())) for _ in range(4)]
 
-        while q._async_not_full_waiting != 4:
+        while q._waiters != 4 * janus._ASYNC_NOT_FULL:
             await asyncio.sleep(0)
 
         q.sync_q.get_nowait()
@@ -393,7 +436,7 @@ class TestMixedMode:
         task = asyncio.create_task(getter())
         await asyncio.sleep(0.01)
         q.shutdown()
-        # q._pending is not empty now
+        # q._async_notifications is not empty now
         await q.wait_closed()
 
         with pytest.raises(janus.AsyncQueueShutDown):
@@ -1,6 +1,7 @@
 # Some simple queue module tests, plus some failure conditions
 # to ensure the Queue locks remain stable.
 import asyncio
+import collections
 import queue
 import re
 import sys
@@ -210,6 +211,30 @@ class BaseQueueTestMixin(BlockingTestMixin):
         _q.close()
         await _q.wait_closed()
 
+    @pytest.mark.asyncio
+    async def test_queue_join_rechecks_unfinished(self):
+        _q = self.type2test()
+        q = _q.sync_q
+        q.put(1)
+        joiner = threading.Thread(target=q.join)
+        joiner.start()
+        while _q._sync_finished is None:
+            time.sleep(0.001)
+        # the count dropped to zero and a new item was put before
+        # the joiner had a chance to run
+        with _q._sync_mutex:
+            sync_finished = _q._sync_finished
+            _q._sync_finished = None
+            sync_finished.set()
+        joiner.join(0.1)
+        assert joiner.is_alive()
+        q.get()
+        q.task_done()
+        joiner.join(10)
+        assert not joiner.is_alive()
+        _q.close()
+        await _q.wait_closed()
+
     @pytest.mark.asyncio
     async def test_simple_queue(self):
         # Do it a couple of times on the same queue.
@@ -231,6 +256,17 @@ class BaseQueueTestMixin(BlockingTestMixin):
         _q.close()
         await _q.wait_closed()
 
+    @pytest.mark.asyncio
+    async def test_non_finite_timeout_without_waiting(self):
+        _q = self.type2test(QUEUE_SIZE)
+        q = _q.sync_q
+        q.put(1, timeout=float("inf"))
+        assert q.get(timeout=float("inf")) == 1
+        q.put(2, timeout=float("nan"))
+        assert q.get(timeout=float("nan")) == 2
+        _q.close()
+        await _q.wait_closed()
+
     @pytest.mark.asyncio
     async def test_nowait(self):
         _q = self.type2test(QUEUE_SIZE)
@@ -258,7 +294,7 @@ class BaseQueueTestMixin(BlockingTestMixin):
         with pytest.raises(queue.Full):
             q.put_nowait(4)
         assert q.qsize() == 3
-        q._maxsize = 2  # shrink the queue
+        _q._maxsize = 2  # shrink the queue
         with pytest.raises(queue.Full):
             q.put_nowait(4)
         _q.close()
@@ -434,6 +470,165 @@ def test_sync_only_api():
     q = janus.Queue()
     q.sync_q.put(1)
     assert q.sync_q.get() == 1
+    # async primitives are not created until async_q is accessed
+    assert q._async_queue is None
+
+
+@pytest.mark.asyncio
+async def test_subclass_overrides_storage_methods():
+    class FifoLifoQueue(janus.LifoQueue):
+        def _get(self):
+            return self._queue.popleft()
+
+    q = FifoLifoQueue()
+    q.sync_q.put(1)
+    q.sync_q.put(2)
+    assert q.sync_q.get() == 1
+    assert q.sync_q.get() == 2
+    await q.aclose()
+
+
+@pytest.mark.asyncio
+async def test_subclass_replaces_storage_in_init():
+    class ReplacingQueue(janus.Queue):
+        def _init(self, maxsize):
+            super()._init(maxsize)
+            self._queue = collections.deque()
+
+    q = ReplacingQueue()
+    q.sync_q.put(1)
+    assert q.sync_q.qsize() == 1
+    assert len(q._queue) == 1
+    assert q.sync_q.get() == 1
+    assert len(q._queue) == 0
+    await q.aclose()
+
+
+@pytest.mark.asyncio
+async def test_put_many_get_many():
+    q = janus.Queue()
+    q.sync_q.put_many(range(5))
+    assert q.sync_q.qsize() == 5
+    assert q.sync_q.get_many(3) == [0, 1, 2]
+    assert q.sync_q.get_many(10) == [3, 4]
+    with pytest.raises(ValueError):
+        q.sync_q.get_many(0)
+    for _ in range(5):
+        q.sync_q.task_done()
+    await q.aclose()
+
+
+@pytest.mark.asyncio
+async def test_put_many_bounded():
+    q = janus.Queue(maxsize=2)
+    results = []
+
+    def consumer():
+        while len(results) < 10:
+            results.extend(q.sync_q.get_many(3, timeout=10))
+
+    threads = [
+        threading.Thread(target=consumer),
+        threading.Thread(target=q.sync_q.put_many, args=(range(10), True, 10)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+        assert not thread.is_alive()
+    assert results == list(range(10))
+
+    async def async_getter():
+        return await q.async_q.get()
+
+    getters = [asyncio.create_task(async_getter()) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    await asyncio.wait_for(
+        asyncio.get_running_loop().run_in_executor(
+            None, q.sync_q.put_many, [1, 2, 3], True, 10
+        ),
+        10,
+    )
+    assert sorted(await asyncio.gather(*getters)) == [1, 2, 3]
+    await q.aclose()
+
+
+@pytest.mark.asyncio
+async def test_put_many_get_many_nonblocking_and_timeout():
+    q = janus.Queue(maxsize=2)
+    with pytest.raises(janus.SyncQueueEmpty):
+        q.sync_q.get_many(3, block=False)
+    with pytest.raises(janus.SyncQueueEmpty):
+        q.sync_q.get_many(3, timeout=0.01)
+    with pytest.raises(ValueError):
+        q.sync_q.get_many(3, timeout=-1)
+    with pytest.raises(ValueError):
+        q.sync_q.put_many([1], timeout=-1)
+    # like put(), the timeout is not validated for an unbounded queue
+    unbounded = janus.Queue()
+    unbounded.sync_q.put_many([1], timeout=-1)
+    assert unbounded.sync_q.get_many(3) == [1]
+    unbounded.sync_q.task_done()
+    await unbounded.aclose()
+    # the deadline is only computed when a put has to wait
+    q.sync_q.put_many([1], timeout=float("inf"))
+    assert q.sync_q.get_many(3) == [1]
+    q.sync_q.task_done()
+
+    # the items put before the queue became full stay there
+    with pytest.raises(janus.SyncQueueFull):
+        q.sync_q.put_many([1, 2, 3], block=False)
+    assert q.sync_q.get_many(3) == [1, 2]
+    with pytest.raises(janus.SyncQueueFull):
+        q.sync_q.put_many([1, 2, 3], timeout=0.01)
+    assert q.sync_q.get_many(3, block=False) == [1, 2]
+    for _ in range(4):
+        q.sync_q.task_done()
+    await q.aclose()
+
+
+@pytest.mark.asyncio
+async def test_put_many_consumes_items_without_lock():
+    q = janus.Queue()
+
+    def items():
+        for i in range(3):
+            assert not q._sync_mutex.locked()
+            # would deadlock if the mutex was held while iterating
+            q.sync_q.put(-i)
+            yield i
+
+    q.sync_q.put_many(items())
+    assert q.sync_q.get_many(10) == [0, -1, -2, 0, 1, 2]
+    for _ in range(6):
+        q.sync_q.task_done()
+    await q.aclose()
+
+
+@pytest.mark.asyncio
+async def test_put_many_shutdown_mid_batch():
+    q = janus.Queue(maxsize=2)
+    errors = []
+
+    def producer():
+        try:
+            q.sync_q.put_many([1, 2, 3, 4], timeout=10)
+        except janus.SyncQueueShutDown as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=producer)
+    thread.start()
+    while q._waiters != janus._SYNC_NOT_FULL:
+        await asyncio.sleep(0.001)
+    q.sync_q.shutdown()
+    thread.join(10)
+    assert not thread.is_alive()
+    assert len(errors) == 1
+    # the part of the batch put before the shutdown stays in the queue
+    assert q.sync_q.get_many(10) == [1, 2]
+    with pytest.raises(janus.SyncQueueShutDown):
+        q.sync_q.get_many(10)
+    await q.aclose()
 
 
 class TestQueueShutdown: